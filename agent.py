@@ -3,11 +3,21 @@
 import os
 import re
 import time
-import json
+import orjson
+import asyncio
+import contextlib
+import hashlib
+import functools
+import threading
+import http.cookiejar
+import httpx
+import diskcache
 import requests
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
 from typing import List, Dict, Tuple, Optional
-from bs4 import BeautifulSoup
-from tenacity import retry, stop_after_attempt, wait_exponential, RetryError as TenacityRetryError
+from urllib.parse import urlparse
+from selectolax.lexbor import LexborHTMLParser
 
 # -------------------- Configuration --------------------
 
@@ -23,24 +33,19 @@ def env_float(name: str, default: float) -> float:
     except Exception:
         return default
 
+RETRY_ATTEMPTS = 3
+
+def retry_delay(attempt: int) -> float:
+    return min(6, 1 << attempt)
+
 # -------------------- URL Processing --------------------
 
 def sanitize_urls(text: str) -> List[str]:
-    urls = []
-    for line in text.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        if "linkedin.com/in/" in line:
-            urls.append(line)
-    seen = set()
-    deduped = []
-    for u in urls:
-        if u not in seen:
-            seen.add(u)
-            deduped.append(u)
-    return deduped
+    marker = "linkedin.com/in/"
+    lines = (line.strip() for line in text.splitlines())
+    return list(dict.fromkeys(line for line in lines if marker in line))
 
+@functools.lru_cache(maxsize=4096)
 def extract_name_from_linkedin(url: str) -> str:
     try:
         slug = url.split("linkedin.com/in/")[1].strip("/")
@@ -51,11 +56,8 @@ def extract_name_from_linkedin(url: str) -> str:
     except Exception:
         return ""
 
+@functools.lru_cache(maxsize=4096)
 def domain_from_url(url: str) -> str:
-    try:
-        from urllib.parse import urlparse
-    except Exception:
-        return ""
     try:
         netloc = urlparse(url).netloc
         return netloc.replace("www.", "")
@@ -64,6 +66,11 @@ def domain_from_url(url: str) -> str:
 
 # -------------------- Web Fetching --------------------
 
+_WS_RE = re.compile(r"[ \t]+")
+_NL_RE = re.compile(r"\n{2,}")
+_TITLE_RE = re.compile(r"<title>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_WS_ALL_RE = re.compile(r"\s+")
+
 DEFAULT_HEADERS = {
     "User-Agent": os.environ.get(
         "LINKEDIN_USER_AGENT",
@@ -73,31 +80,67 @@ DEFAULT_HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+def http_session() -> requests.Session:
+    """
+    Shared keep-alive session so repeated LinkedIn/SerpAPI hits reuse pooled connections.
+    Its cookie jar never stores Set-Cookie: the session is shared across threads and users,
+    so cookies (li_at) are passed per request only.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update(DEFAULT_HEADERS)
+                session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+                _SESSION = session
+    return _SESSION
+
 def linkedin_cookies() -> dict:
     li_at = os.environ.get("LINKEDIN_LI_AT", "").strip()
     return {"li_at": li_at} if li_at else {}
 
+FETCH_MAX_BYTES = 256 * 1024
+
 def fetch_url(url: str, timeout: int = 15) -> Tuple[Optional[str], int, str]:
+    """Fetch at most FETCH_MAX_BYTES of a page; snippets only ever keep the first ~1600 chars."""
     try:
-        r = requests.get(url, headers=DEFAULT_HEADERS, cookies=linkedin_cookies(), timeout=timeout)
-        if r.status_code == 200 and r.text:
-            return r.text, 200, "ok"
-        return None, r.status_code, f"http_status_{r.status_code}"
+        with http_session().get(url, cookies=linkedin_cookies(), timeout=timeout, stream=True) as r:
+            if r.status_code != 200:
+                return None, r.status_code, f"http_status_{r.status_code}"
+            buf = bytearray()
+            for chunk in r.iter_content(chunk_size=65536):
+                buf += chunk
+                if len(buf) >= FETCH_MAX_BYTES:
+                    break
+            try:
+                text = buf.decode(r.encoding or "utf-8", errors="replace")
+            except LookupError:
+                text = buf.decode("utf-8", errors="replace")
+        if text:
+            return text, 200, "ok"
+        return None, 200, "http_status_200"
     except requests.RequestException as e:
         return None, 0, f"request_error:{e}"
 
 def visible_text_from_html(html: str) -> str:
-    soup = BeautifulSoup(html, "lxml")
-    for tag in soup(["script", "style", "noscript"]):
-        tag.extract()
+    tree = LexborHTMLParser(html)
+    for tag in tree.css("script, style, noscript"):
+        tag.decompose()
     og_desc = ""
-    og = soup.find("meta", {"property": "og:description"})
-    if og and og.get("content"):
-        og_desc = og["content"]
-    text = soup.get_text(separator="\n")
+    og = tree.css_first('meta[property="og:description"]')
+    if og is not None:
+        og_desc = og.attributes.get("content") or ""
+    text = tree.body.text(separator="\n") if tree.body is not None else ""
     combined = f"{og_desc}\n{text}"
-    combined = re.sub(r"[ \t]+", " ", combined)
-    combined = re.sub(r"\n{2,}", "\n", combined)
+    combined = _WS_RE.sub(" ", combined)
+    combined = _NL_RE.sub("\n", combined)
     return combined.strip()
 
 # -------------------- SerpAPI Integration --------------------
@@ -110,18 +153,128 @@ def serp_key_required() -> str:
         raise RuntimeError("Missing SERPAPI_API_KEY")
     return key
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=6))
-def serp_search(query: str, num: int = 5, engine: str = "google") -> List[Dict]:
-    params = {
+SERP_CONCURRENCY = 10
+HOST_RATE_LIMIT = 10  # requests per second, per host
+
+# Shared by every worker thread and event loop, so the caps hold process-wide.
+_SERP_SLOTS = threading.BoundedSemaphore(SERP_CONCURRENCY)
+_HOST_NEXT_SLOT: Dict[str, float] = {}
+_HOST_SLOT_LOCK = threading.Lock()
+
+async def throttle_host(url: str) -> None:
+    """Reserve the next 1/HOST_RATE_LIMIT slot for the url's host and sleep until it comes up."""
+    host = domain_from_url(url)
+    with _HOST_SLOT_LOCK:
+        now = time.monotonic()
+        slot = max(now, _HOST_NEXT_SLOT.get(host, now))
+        # Hosts whose next slot has already passed are unthrottled anyway; dropping them keeps
+        # the map to hosts with a reservation still pending in long-lived servers.
+        for idle in [h for h, next_slot in _HOST_NEXT_SLOT.items() if next_slot <= now]:
+            del _HOST_NEXT_SLOT[idle]
+        _HOST_NEXT_SLOT[host] = slot + 1 / HOST_RATE_LIMIT
+    if slot > now:
+        await asyncio.sleep(slot - now)
+
+@contextlib.asynccontextmanager
+async def serp_slot():
+    """Hold one of the SERP_CONCURRENCY in-flight SerpAPI slots, paced by the serpapi.com rate limit."""
+    # Polled rather than awaited via asyncio.to_thread(_SERP_SLOTS.acquire): a blocked acquire
+    # would pin a default-executor thread per waiting query (starving the page fetches and cache
+    # I/O that share that pool), and a waiter cancelled by asyncio.run would leak its slot since
+    # the thread cannot be interrupted. Each check is a non-blocking acquire, so waiting is cheap.
+    while not _SERP_SLOTS.acquire(blocking=False):
+        await asyncio.sleep(0.05)
+    try:
+        await throttle_host(SERP_API_URL)
+        yield
+    finally:
+        _SERP_SLOTS.release()
+
+SERP_CACHE_DIR = os.environ.get("SERP_CACHE_DIR", ".serp_cache")
+SERP_CACHE_TTL = env_int("SERP_CACHE_TTL", 3600)
+
+SERP_MEMO_MAX_ENTRIES = 2048
+
+_SERP_MEMO: "OrderedDict[str, Tuple[float, List[Dict]]]" = OrderedDict()
+_SERP_MEMO_LOCK = threading.Lock()
+_DISK_CACHES: Dict[str, diskcache.Cache] = {}
+_DISK_CACHES_LOCK = threading.Lock()
+
+def disk_cache(directory: str, size_limit: int) -> diskcache.Cache:
+    cache = _DISK_CACHES.get(directory)
+    if cache is None:
+        with _DISK_CACHES_LOCK:
+            cache = _DISK_CACHES.get(directory)
+            if cache is None:
+                cache = diskcache.Cache(directory, size_limit=size_limit)
+                _DISK_CACHES[directory] = cache
+    return cache
+
+def serp_disk_cache() -> diskcache.Cache:
+    return disk_cache(SERP_CACHE_DIR, 1 << 30)
+
+def serp_cache_key(query: str, num: int, engine: str) -> str:
+    return hashlib.blake2b(f"{engine}|{query}|{num}".encode("utf-8")).hexdigest()
+
+def serp_memo_get(key: str) -> Optional[List[Dict]]:
+    with _SERP_MEMO_LOCK:
+        hit = _SERP_MEMO.get(key)
+        if hit is None:
+            return None
+        if hit[0] <= time.time():
+            del _SERP_MEMO[key]
+            return None
+        _SERP_MEMO.move_to_end(key)
+        return hit[1]
+
+def serp_memo_set(key: str, expires_at: float, results: List[Dict]) -> None:
+    """LRU insert that also drops expired entries, so the memo stays bounded in long-lived servers."""
+    with _SERP_MEMO_LOCK:
+        now = time.time()
+        for stale in [k for k, (exp, _) in _SERP_MEMO.items() if exp <= now]:
+            del _SERP_MEMO[stale]
+        _SERP_MEMO[key] = (expires_at, results)
+        _SERP_MEMO.move_to_end(key)
+        while len(_SERP_MEMO) > SERP_MEMO_MAX_ENTRIES:
+            _SERP_MEMO.popitem(last=False)
+
+async def serp_cache_get(key: str) -> Optional[List[Dict]]:
+    results = serp_memo_get(key)
+    if results is not None:
+        return results
+    results, expires_at = await asyncio.to_thread(serp_disk_cache().get, key, expire_time=True)
+    if results is None:
+        return None
+    serp_memo_set(key, expires_at or time.time() + SERP_CACHE_TTL, results)
+    return results
+
+async def serp_cache_set(key: str, results: List[Dict]) -> None:
+    serp_memo_set(key, time.time() + SERP_CACHE_TTL, results)
+    await asyncio.to_thread(serp_disk_cache().set, key, results, expire=SERP_CACHE_TTL)
+
+def serp_cached(fn):
+    """Serve repeat (query, num, engine) searches from memory/disk instead of spending a SerpAPI credit."""
+    @functools.wraps(fn)
+    async def wrapper(query: str, num: int = 5, engine: str = "google", **kwargs) -> List[Dict]:
+        key = serp_cache_key(query, num, engine)
+        cached = await serp_cache_get(key)
+        if cached is not None:
+            return cached
+        results = await fn(query, num, engine, **kwargs)
+        await serp_cache_set(key, results)
+        return results
+    return wrapper
+
+def serp_params(query: str, num: int, engine: str) -> Dict:
+    return {
         "engine": engine,
         "q": query,
         "api_key": serp_key_required(),
-        "num": num,
+        "num": str(num),
         "hl": "en"
     }
-    resp = requests.get(SERP_API_URL, params=params, timeout=30)
-    resp.raise_for_status()
-    data = resp.json()
+
+def serp_results(data: Dict, query: str) -> List[Dict]:
     results = []
     for item in data.get("organic_results", []):
         results.append({
@@ -133,6 +286,75 @@ def serp_search(query: str, num: int = 5, engine: str = "google") -> List[Dict]:
         })
     return results
 
+SERP_ARCHIVE_URL = "https://serpapi.com/searches/{search_id}.json"
+SERP_ASYNC = bool(env_int("SERP_ASYNC", 0))
+SERP_POLL_INITIAL_DELAY = 1.0
+SERP_POLL_TIMEOUT = 60
+
+async def serp_search_submit(query: str, num: int, engine: str, *,
+                             client: httpx.AsyncClient) -> Dict:
+    """
+    Run a search. With SERP_ASYNC it is only queued (async=true) and SerpAPI returns its
+    search_metadata immediately; results then come from serp_search_poll.
+    """
+    params = serp_params(query, num, engine)
+    if SERP_ASYNC:
+        params["async"] = "true"
+    last_error: Optional[Exception] = None
+    for attempt in range(RETRY_ATTEMPTS):
+        try:
+            async with serp_slot():
+                resp = await client.get(SERP_API_URL, params=params)
+                resp.raise_for_status()
+                return resp.json()
+        except Exception as e:
+            last_error = e
+            if attempt + 1 < RETRY_ATTEMPTS:
+                await asyncio.sleep(retry_delay(attempt))
+    raise last_error
+
+async def serp_search_poll(search_id: str, *, client: httpx.AsyncClient) -> Dict:
+    """
+    Poll an already-submitted search until it settles. Transient poll failures keep polling the
+    same search_id rather than re-submitting, since every submission bills a credit.
+    Archive GETs are not billed, so they skip serp_slot and the serpapi.com throttle.
+    """
+    url = SERP_ARCHIVE_URL.format(search_id=search_id)
+    deadline = time.monotonic() + SERP_POLL_TIMEOUT
+    delay = SERP_POLL_INITIAL_DELAY
+    status, last_error = None, None
+    while True:
+        await asyncio.sleep(delay)
+        try:
+            resp = await client.get(url, params={"api_key": serp_key_required()})
+            resp.raise_for_status()
+            data = resp.json()
+        except httpx.HTTPStatusError as e:
+            if 400 <= e.response.status_code < 500 and e.response.status_code != 429:
+                raise
+            last_error = e
+        except Exception as e:
+            last_error = e
+        else:
+            status = data.get("search_metadata", {}).get("status")
+            if status == "Success":
+                return data
+            if status == "Error":
+                raise RuntimeError(f"SerpAPI search {search_id} failed: {data.get('error', 'unknown error')}")
+        delay = min(delay * 2, 4)
+        if time.monotonic() + delay > deadline:
+            raise TimeoutError(
+                f"SerpAPI search {search_id} still {status or 'pending'} after {SERP_POLL_TIMEOUT}s"
+            ) from last_error
+
+@serp_cached
+async def serp_search_async(query: str, num: int = 5, engine: str = "google", *,
+                            client: httpx.AsyncClient) -> List[Dict]:
+    data = await serp_search_submit(query, num, engine, client=client)
+    if "organic_results" not in data:
+        data = await serp_search_poll(data.get("search_metadata", {})["id"], client=client)
+    return serp_results(data, query)
+
 def dedupe_links(items: List[Dict]) -> List[Dict]:
     seen = set()
     out = []
@@ -165,36 +387,71 @@ DISCOVERY_QUERIES = [
 
 # -------------------- Evidence Collection --------------------
 
-def collect_entrepreneur_evidence(name: str, results_per_query: int, passes: int) -> Tuple[List[Dict], List[Dict]]:
-    queries = ENTREPRENEUR_QUERIES[:]
-    queries = queries[: passes * 3]
-    trav, results = [], []
-    for q in queries:
-        query = q.format(name=name)
-        trav.append({"action": "serp_search", "query": query})
-        try:
-            res = serp_search(query, num=results_per_query)
-        except Exception as e:
-            trav.append({"action": "error", "query": query, "error": str(e)})
-            res = []
-        results.extend(res)
+QUERIES_PER_PASS = 3
+DISCOVERY_FETCH_LIMIT = 8
+
+def query_key(query: str) -> str:
+    return " ".join(query.lower().split())
+
+async def run_serp_queries(queries: List[str], action: str, results_per_query: int,
+                           client: httpx.AsyncClient, issued: Dict[str, asyncio.Task],
+                           stop_after: Optional[int] = None) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Issue queries concurrently, skipping repeats within the list and sharing the in-flight search
+    when another list in the same run (tracked in issued) already sent the same query.
+    With stop_after set, and reachable by the first pass alone, queries go one pass
+    (QUERIES_PER_PASS) at a time and later passes are skipped once that many unique links are found.
+    """
+    trav, own, unique = [], set(), []
+    for query in queries:
+        key = query_key(query)
+        if key in own:
+            trav.append({"action": "skip_duplicate_query", "query": query})
+            continue
+        own.add(key)
+        unique.append(query)
+    
+    early_exit = stop_after is not None and stop_after <= QUERIES_PER_PASS * results_per_query
+    wave_size = QUERIES_PER_PASS if early_exit else max(len(unique), 1)
+    results = []
+    for start in range(0, len(unique), wave_size):
+        wave = unique[start: start + wave_size]
+        tasks = []
+        for query in wave:
+            key = query_key(query)
+            if key in issued:
+                trav.append({"action": "shared_query", "query": query})
+            else:
+                issued[key] = asyncio.ensure_future(serp_search_async(query, num=results_per_query, client=client))
+            tasks.append(issued[key])
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        for query, res in zip(wave, outcomes):
+            trav.append({"action": action, "query": query})
+            if isinstance(res, BaseException):
+                trav.append({"action": "error", "query": query, "error": str(res)})
+                continue
+            results.extend(res)
+        remaining = len(unique) - start - len(wave)
+        if early_exit and remaining and len(dedupe_links(results)) >= stop_after:
+            trav.append({"action": "early_exit", "unique_results": len(dedupe_links(results)), "skipped_queries": remaining})
+            break
+    return results, trav
+
+async def collect_entrepreneur_evidence(name: str, results_per_query: int, passes: int,
+                                        client: httpx.AsyncClient, issued: Dict[str, asyncio.Task]) -> Tuple[List[Dict], List[Dict]]:
+    fields = {"name": name}
+    queries = [q.format_map(fields) for q in ENTREPRENEUR_QUERIES[: passes * QUERIES_PER_PASS]]
+    results, trav = await run_serp_queries(queries, "serp_search", results_per_query, client, issued)
     results = dedupe_links(results)
     trav.append({"action": "entrepreneur_aggregate", "total_results": len(results)})
     return results, trav
 
-def discover_personal_sources(name: str, results_per_query: int, passes: int) -> Tuple[List[Dict], List[Dict]]:
-    queries = DISCOVERY_QUERIES[:]
-    queries = queries[: passes * 3]
-    trav, urls = [], []
-    for q in queries:
-        query = q.format(name=name)
-        trav.append({"action": "serp_discovery", "query": query})
-        try:
-            res = serp_search(query, num=results_per_query)
-        except Exception as e:
-            trav.append({"action": "error", "query": query, "error": str(e)})
-            res = []
-        urls.extend(res)
+async def discover_personal_sources(name: str, results_per_query: int, passes: int,
+                                    client: httpx.AsyncClient, issued: Dict[str, asyncio.Task]) -> Tuple[List[Dict], List[Dict]]:
+    fields = {"name": name}
+    queries = [q.format_map(fields) for q in DISCOVERY_QUERIES[: passes * QUERIES_PER_PASS]]
+    urls, trav = await run_serp_queries(queries, "serp_discovery", results_per_query, client, issued,
+                                        stop_after=DISCOVERY_FETCH_LIMIT)
     urls = dedupe_links(urls)
     trav.append({"action": "discovery_aggregate", "total_results": len(urls)})
     return urls, trav
@@ -207,9 +464,9 @@ def fetch_and_snippet(url: str, max_chars: int = 1200) -> Optional[Dict]:
     snippet = text[:max_chars].replace("\n", " ").strip()
     title = ""
     try:
-        m = re.search(r"<title>(.*?)</title>", html, flags=re.IGNORECASE | re.DOTALL)
+        m = _TITLE_RE.search(html)
         if m:
-            title = re.sub(r"\s+", " ", m.group(1)).strip()
+            title = _WS_ALL_RE.sub(" ", m.group(1)).strip()
     except Exception:
         title = ""
     return {
@@ -220,29 +477,42 @@ def fetch_and_snippet(url: str, max_chars: int = 1200) -> Optional[Dict]:
         "source_domain": domain_from_url(url)
     }
 
-def collect_profile_corpus(profile_url: str, name: str, results_per_query: int, passes: int) -> Tuple[List[Dict], List[Dict]]:
-    trav = [{"action": "fetch_linkedin", "url": profile_url}]
-    html, status, note = fetch_url(profile_url)
-    trav.append({"action": "fetch_linkedin_result", "status": status, "note": note})
-    corpus = []
-    if html:
-        text = visible_text_from_html(html)
-        trav.append({"action": "linkedin_text_len", "length": len(text)})
-        if len(text) > 400:
-            corpus.append({
-                "query": "linkedin_profile",
-                "title": "LinkedIn profile (parsed)",
-                "link": profile_url,
-                "snippet": text[:1600].replace("\n", " ").strip(),
-                "source_domain": "linkedin.com"
-            })
+async def fetch_and_snippet_async(url: str) -> Optional[Dict]:
+    await throttle_host(url)
+    return await asyncio.to_thread(fetch_and_snippet, url)
+
+async def collect_profile_corpus(profile_url: str, name: str, results_per_query: int, passes: int,
+                                 client: httpx.AsyncClient, issued: Dict[str, asyncio.Task]) -> Tuple[List[Dict], List[Dict]]:
+    trav, corpus = [], []
+    if linkedin_cookies():
+        trav.append({"action": "fetch_linkedin", "url": profile_url})
+        await throttle_host(profile_url)
+        html, status, note = await asyncio.to_thread(fetch_url, profile_url)
+        trav.append({"action": "fetch_linkedin_result", "status": status, "note": note})
+        if html:
+            text = visible_text_from_html(html)
+            trav.append({"action": "linkedin_text_len", "length": len(text)})
+            if len(text) > 400:
+                corpus.append({
+                    "query": "linkedin_profile",
+                    "title": "LinkedIn profile (parsed)",
+                    "link": profile_url,
+                    "snippet": text[:1600].replace("\n", " ").strip(),
+                    "source_domain": "linkedin.com"
+                })
+    else:
+        # Without li_at LinkedIn only serves its auth wall, which never clears the 400-char bar.
+        trav.append({"action": "skip_linkedin", "reason": "no_li_at"})
     if not corpus or len(corpus[0]["snippet"]) < 400:
-        discovered, trav_d = discover_personal_sources(name, results_per_query, passes)
+        discovered, trav_d = await discover_personal_sources(name, results_per_query, passes, client, issued)
         trav.extend(trav_d)
+        fetched = await asyncio.gather(
+            *(fetch_and_snippet_async(item["link"]) for item in discovered[: DISCOVERY_FETCH_LIMIT]),
+            return_exceptions=True
+        )
         fetched_any = 0
-        for item in discovered[: 8]:
-            page = fetch_and_snippet(item["link"])
-            if page and len(page.get("snippet","")) > 400:
+        for page in fetched:
+            if isinstance(page, dict) and len(page.get("snippet","")) > 400:
                 corpus.append(page)
                 fetched_any += 1
             if fetched_any >= 5:
@@ -250,6 +520,17 @@ def collect_profile_corpus(profile_url: str, name: str, results_per_query: int,
         trav.append({"action": "personal_sources_used", "count": fetched_any})
     return corpus, trav
 
+async def collect_evidence_async(profile_url: str, name: str, results_per_query: int, passes: int) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    """Run corpus and entrepreneur collection concurrently over one HTTP/2 client."""
+    limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    issued: Dict[str, asyncio.Task] = {}
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=30) as client:
+        (pages, trav_pages), (ent_evidence, trav_ent) = await asyncio.gather(
+            collect_profile_corpus(profile_url, name, results_per_query, passes, client, issued),
+            collect_entrepreneur_evidence(name, results_per_query, passes, client, issued),
+        )
+    return pages, ent_evidence, trav_pages + trav_ent
+
 # -------------------- Analysis --------------------
 
 def load_prompt_template() -> str:
@@ -263,25 +544,24 @@ def load_prompt_template() -> str:
 
 PROMPT_TEMPLATE = load_prompt_template()
 
-def openai_client():
-    try:
-        from openai import OpenAI
-    except Exception as e:
-        raise RuntimeError("openai package not installed. `pip install openai`") from e
-    
+def openai_api_key() -> str:
     api_key = os.environ.get("OPENAI_API_KEY", "").strip()
     if not api_key:
         raise RuntimeError("Missing OPENAI_API_KEY")
     
     if not api_key.startswith("sk-"):
         raise RuntimeError(f"Invalid OPENAI_API_KEY format. Should start with 'sk-' but got: '{api_key[:10]}...'")
-    
+    return api_key
+
+@functools.lru_cache(maxsize=1)
+def openai_client():
+    # Memoized; callers that change OPENAI_API_KEY must call openai_client.cache_clear().
     try:
-        client = OpenAI(api_key=api_key)
-        client.models.list()
-        return client
+        from openai import OpenAI
     except Exception as e:
-        raise RuntimeError(f"OpenAI authentication failed. Please check your API key. Error: {str(e)}") from e
+        raise RuntimeError("openai package not installed. `pip install openai`") from e
+    
+    return OpenAI(api_key=openai_api_key())
 
 def openai_model() -> str:
     return os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
@@ -293,134 +573,210 @@ def openai_temp() -> float:
         return 1.0
     return env_float("OPENAI_TEMPERATURE", 0.1)
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=6))
-def judge_with_llm(profile_url: str, name_guess: str, pages: List[Dict], search_evidence: List[Dict]) -> Dict:
-    payload = {
-        "pages": pages,
-        "search_evidence": search_evidence
-    }
-    
+JUDGE_SYSTEM_PROMPT = "You are an expert talent researcher. Respond with strict JSON only."
+JUDGE_FALLBACK_SYSTEM_PROMPT = "You are an expert talent researcher. Respond with strict JSON only. Return JSON object, no prose."
+
+LLM_CACHE_DIR = os.environ.get("LLM_CACHE_DIR", ".llm_cache")
+LLM_CACHE_TTL = env_int("LLM_CACHE_TTL", 86400)
+
+def llm_cache_key(user_msg: str) -> str:
+    return hashlib.sha256(f"{openai_model()}|{openai_temp()}|{user_msg}".encode("utf-8")).hexdigest()
+
+def llm_cache_get(key: str) -> Optional[Dict]:
+    return disk_cache(LLM_CACHE_DIR, 2 << 30).get(key)
+
+def llm_cache_set(key: str, data: Dict) -> None:
+    disk_cache(LLM_CACHE_DIR, 2 << 30).set(key, data, expire=LLM_CACHE_TTL)
+
+HIGH_SIGNAL_DOMAINS = (
+    "linkedin.com", "crunchbase.com", "techcrunch.com", "yc.com", "news.ycombinator.com",
+    "angel.co", "wellfound.com", "substack.com", "medium.com", "github.io", "github.com",
+)
+MAX_PROMPT_PAGES = 8
+EVIDENCE_SNIPPET_CHARS = 400
+
+def score_source(item: Dict) -> int:
+    """Sort key: 0 for high-signal domains, 1 for everything else."""
+    domain = item.get("source_domain", "")
+    return 0 if any(domain == d or domain.endswith("." + d) for d in HIGH_SIGNAL_DOMAINS) else 1
+
+def compact_pages(pages: List[Dict]) -> List[Dict]:
+    """High-signal pages first, at most MAX_PROMPT_PAGES, without the internal query label."""
+    return [
+        {"title": p.get("title", ""), "link": p.get("link", ""), "source_domain": p.get("source_domain", ""),
+         "snippet": p.get("snippet", "")}
+        for p in sorted(pages, key=score_source)[:MAX_PROMPT_PAGES]
+    ]
+
+def search_evidence_markdown(search_evidence: List[Dict]) -> str:
+    """High-signal hits first, one markdown bullet per hit with its snippet capped at EVIDENCE_SNIPPET_CHARS."""
+    lines = []
+    for it in sorted(search_evidence, key=score_source):
+        lines.append(f"- {it.get('title', '')} ({it.get('link', '')})")
+        snippet = " ".join(it.get("snippet", "").split())[:EVIDENCE_SNIPPET_CHARS]
+        if snippet:
+            lines.append(f"  {snippet}")
+    return "\n".join(lines) or "(none)"
+
+def build_judge_prompt(profile_url: str, name_guess: str, pages: List[Dict], search_evidence: List[Dict]) -> str:
     try:
-        user_msg = PROMPT_TEMPLATE.format(
+        return PROMPT_TEMPLATE.format(
             profile_url=profile_url,
             name_guess=name_guess,
-            evidence_json=json.dumps(payload, ensure_ascii=False)
+            evidence_json=orjson.dumps({"pages": compact_pages(pages)}).decode("utf-8"),
+            search_evidence=search_evidence_markdown(search_evidence)
         )
     except KeyError as e:
         raise RuntimeError(f"Prompt template formatting error - missing placeholder: {e}")
     except Exception as e:
         raise RuntimeError(f"Prompt template formatting error: {e}")
+
+def judge_messages(system_prompt: str, user_msg: str) -> List[Dict]:
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_msg}
+    ]
+
+def parse_judge_response(raw_content: str) -> Dict:
+    try:
+        data = orjson.loads(raw_content)
+    except orjson.JSONDecodeError as e:
+        raise RuntimeError(f"Failed to parse JSON response: {e}. Raw content: {raw_content[:500]}...")
+    
+    data.setdefault("source_confidence_assessments", [])
+    data.setdefault("high_confidence_sources_used", [])
+    data.setdefault("entrepreneurial_score", 0.0)
+    data.setdefault("contrarian_multiplier", 1.0)
+    data.setdefault("final_score", 0.0)
+    data.setdefault("entrepreneurial_evidence_points", [])
+    data.setdefault("contrarian_evidence_points", [])
+    data.setdefault("summary", "")
+    data.setdefault("confidence", 0.0)
+    
+    if data["contrarian_multiplier"] > 1.5:
+        data["contrarian_multiplier"] = 1.5
+    elif data["contrarian_multiplier"] < 1.0:
+        data["contrarian_multiplier"] = 1.0
+    
+    return data
+
+def judge_with_llm(profile_url: str, name_guess: str, pages: List[Dict], search_evidence: List[Dict]) -> Dict:
+    user_msg = build_judge_prompt(profile_url, name_guess, pages, search_evidence)
+    cache_key = llm_cache_key(user_msg)
+    cached = llm_cache_get(cache_key)
+    if cached is not None:
+        return cached
     
     client = openai_client()
     
-    try:
+    last_error: Optional[Exception] = None
+    for attempt in range(RETRY_ATTEMPTS):
         try:
-            resp = client.chat.completions.create(
-                model=openai_model(),
-                temperature=openai_temp(),
-                messages=[
-                    {"role": "system", "content": "You are an expert talent researcher. Respond with strict JSON only."},
-                    {"role": "user", "content": user_msg}
-                ],
-                response_format={"type": "json_object"}
-            )
-        except Exception:
+            try:
+                resp = client.chat.completions.create(
+                    model=openai_model(),
+                    temperature=openai_temp(),
+                    messages=judge_messages(JUDGE_SYSTEM_PROMPT, user_msg),
+                    response_format={"type": "json_object"}
+                )
+            except Exception:
+                
+                resp = client.chat.completions.create(
+                    model=openai_model(),
+                    temperature=openai_temp(),
+                    messages=judge_messages(JUDGE_FALLBACK_SYSTEM_PROMPT, user_msg)
+                )
             
-            resp = client.chat.completions.create(
-                model=openai_model(),
-                temperature=openai_temp(),
-                messages=[
-                    {"role": "system", "content": "You are an expert talent researcher. Respond with strict JSON only. Return JSON object, no prose."},
-                    {"role": "user", "content": user_msg}
-                ]
-            )
-        
-        raw_content = resp.choices[0].message.content
-        
-        try:
-            data = json.loads(raw_content)
-        except json.JSONDecodeError as e:
-            raise RuntimeError(f"Failed to parse JSON response: {e}. Raw content: {raw_content[:500]}...")
-        
-        data.setdefault("source_confidence_assessments", [])
-        data.setdefault("high_confidence_sources_used", [])
-        data.setdefault("entrepreneurial_score", 0.0)
-        data.setdefault("contrarian_multiplier", 1.0)
-        data.setdefault("final_score", 0.0)
-        data.setdefault("entrepreneurial_evidence_points", [])
-        data.setdefault("contrarian_evidence_points", [])
-        data.setdefault("summary", "")
-        data.setdefault("confidence", 0.0)
-        
-        if data["contrarian_multiplier"] > 1.5:
-            data["contrarian_multiplier"] = 1.5
-        elif data["contrarian_multiplier"] < 1.0:
-            data["contrarian_multiplier"] = 1.0
-        
-        return data
-        
-    except Exception as e:
-        raise RuntimeError(f"Error in LLM judging for {profile_url}: {str(e)}") from e
+            data = parse_judge_response(resp.choices[0].message.content)
+            llm_cache_set(cache_key, data)
+            return data
+            
+        except Exception as e:
+            last_error = e
+            if attempt + 1 < RETRY_ATTEMPTS:
+                time.sleep(retry_delay(attempt))
+    
+    raise RuntimeError(f"Error in LLM judging for {profile_url}: {str(last_error)}") from last_error
 
 # -------------------- Main Analysis Function --------------------
 
-def score_one_profile(profile_url: str, results_per_query: int, passes: int) -> Dict:
+def error_report(profile_url: str, name: str, traversal: List[Dict], e: BaseException) -> Dict:
+    root_msg = str(e)
+    return {
+        "profile_url": profile_url,
+        "name_guess": name,
+        "entrepreneurial_score": 0.0,
+        "contrarian_multiplier": 1.0,
+        "final_score": 0.0,
+        "summary": f"Error during analysis: {root_msg}",
+        "confidence": 0.0,
+        "entrepreneurial_evidence_points": [],
+        "contrarian_evidence_points": [],
+        "source_confidence_assessments": [],
+        "high_confidence_sources_used": [],
+        "pages": [],
+        "search_evidence": [],
+        "traversal_log": traversal,
+        "error": root_msg
+    }
+
+def profile_report(evidence: Dict, llm_result: Dict) -> Dict:
+    return {
+        "profile_url": evidence["profile_url"],
+        "name_guess": evidence["name_guess"],
+        "entrepreneurial_score": float(llm_result.get("entrepreneurial_score", 0.0)),
+        "contrarian_multiplier": float(llm_result.get("contrarian_multiplier", 1.0)),
+        "final_score": float(llm_result.get("final_score", 0.0)),
+        "summary": llm_result.get("summary", ""),
+        "confidence": float(llm_result.get("confidence", 0.0)),
+        "entrepreneurial_evidence_points": list(llm_result.get("entrepreneurial_evidence_points", [])),
+        "contrarian_evidence_points": list(llm_result.get("contrarian_evidence_points", [])),
+        "source_confidence_assessments": list(llm_result.get("source_confidence_assessments", [])),
+        "high_confidence_sources_used": list(llm_result.get("high_confidence_sources_used", [])),
+        "pages": evidence["pages"],
+        "search_evidence": evidence["search_evidence"],
+        "traversal_log": evidence["traversal_log"]
+    }
 
+def collect_profile_evidence(profile_url: str, results_per_query: int, passes: int) -> Dict:
+    """
+    Gather pages and search evidence for one profile without calling the LLM.
+    
+    Returns:
+        Evidence dict (profile_url, name_guess, pages, search_evidence, traversal_log),
+        or an error report (with an "error" key) if collection failed.
+    """
     name = extract_name_from_linkedin(profile_url) or profile_url.strip("/").split("/")[-1].replace("-", " ").strip()
     traversal = []
     
     try:
-        pages, trav_pages = collect_profile_corpus(profile_url, name, results_per_query, passes)
-        traversal.extend(trav_pages)
-        
-        ent_evidence, trav_ent = collect_entrepreneur_evidence(name, results_per_query, passes)
-        traversal.extend(trav_ent)
-
-        llm_result = judge_with_llm(profile_url, name, pages, ent_evidence)
-
+        pages, ent_evidence, trav_evidence = asyncio.run(
+            collect_evidence_async(profile_url, name, results_per_query, passes)
+        )
+        traversal.extend(trav_evidence)
         return {
             "profile_url": profile_url,
             "name_guess": name,
-            "entrepreneurial_score": float(llm_result.get("entrepreneurial_score", 0.0)),
-            "contrarian_multiplier": float(llm_result.get("contrarian_multiplier", 1.0)),
-            "final_score": float(llm_result.get("final_score", 0.0)),
-            "summary": llm_result.get("summary", ""),
-            "confidence": float(llm_result.get("confidence", 0.0)),
-            "entrepreneurial_evidence_points": list(llm_result.get("entrepreneurial_evidence_points", [])),
-            "contrarian_evidence_points": list(llm_result.get("contrarian_evidence_points", [])),
-            "source_confidence_assessments": list(llm_result.get("source_confidence_assessments", [])),
-            "high_confidence_sources_used": list(llm_result.get("high_confidence_sources_used", [])),
             "pages": pages,
             "search_evidence": ent_evidence,
             "traversal_log": traversal
         }
-        
     except Exception as e:
-        
-        root_msg = str(e)
-        if isinstance(e, TenacityRetryError):
-            try:
-                cause = e.last_attempt.exception()
-                root_msg = f"{type(cause).__name__}: {cause}"
-            except Exception:
-                root_msg = str(e)
-        return {
-            "profile_url": profile_url,
-            "name_guess": name,
-            "entrepreneurial_score": 0.0,
-            "contrarian_multiplier": 1.0,
-            "final_score": 0.0,
-            "summary": f"Error during analysis: {root_msg}",
-            "confidence": 0.0,
-            "entrepreneurial_evidence_points": [],
-            "contrarian_evidence_points": [],
-            "source_confidence_assessments": [],
-            "high_confidence_sources_used": [],
-            "pages": [],
-            "search_evidence": [],
-            "traversal_log": traversal,
-            "error": root_msg
-        }
+        return error_report(profile_url, name, traversal, e)
+
+def score_collected_profile(evidence: Dict) -> Dict:
+    """Judge evidence from collect_profile_evidence; error reports pass straight through."""
+    if "error" in evidence:
+        return evidence
+    
+    try:
+        llm_result = judge_with_llm(evidence["profile_url"], evidence["name_guess"], evidence["pages"], evidence["search_evidence"])
+        return profile_report(evidence, llm_result)
+    except Exception as e:
+        return error_report(evidence["profile_url"], evidence["name_guess"], evidence["traversal_log"], e)
+
+def score_one_profile(profile_url: str, results_per_query: int, passes: int) -> Dict:
+    return score_collected_profile(collect_profile_evidence(profile_url, results_per_query, passes))
 
 # -------------------- API Validation --------------------
 
@@ -433,8 +789,12 @@ def validate_apis() -> Tuple[bool, str]:
     """
     try:
         test_client = openai_client()
+        try:
+            test_client.models.list()
+        except Exception as e:
+            raise RuntimeError(f"OpenAI authentication failed. Please check your API key. Error: {str(e)}") from e
         
-        test_resp = requests.get(SERP_API_URL, params={
+        test_resp = http_session().get(SERP_API_URL, params={
             "engine": "google", "q": "test", "api_key": serp_key_required(), "num": 1
         }, timeout=10)
         
@@ -5,13 +5,15 @@ UI-only application that uses the agent module for business logic.
 """
 
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import pandas as pd
 import streamlit as st
 from agent import (
     sanitize_urls, 
-    score_one_profile, 
+    collect_profile_evidence, 
+    score_collected_profile, 
     validate_apis,
+    openai_client,
     env_int
 )
 
@@ -43,7 +45,9 @@ with st.sidebar:
     linkedin_li_at = st.text_input("LinkedIn cookie (optional)", value=os.environ.get("LINKEDIN_LI_AT", ""), type="password")
     
     if serp_key: os.environ["SERPAPI_API_KEY"] = serp_key
-    if openai_key: os.environ["OPENAI_API_KEY"] = openai_key
+    if openai_key and openai_key != os.environ.get("OPENAI_API_KEY"):
+        os.environ["OPENAI_API_KEY"] = openai_key
+        openai_client.cache_clear()
     os.environ["OPENAI_MODEL"] = model_name
     os.environ["OPENAI_TEMPERATURE"] = str(temperature)
     os.environ["RESULTS_PER_QUERY"] = str(int(max_results_per_query))
@@ -194,24 +198,48 @@ if run:
         st.error(error_msg)
         st.stop()
     
-    results = []
+    results_by_url = {}
     progress = st.progress(0.0)
     status = st.empty()
+    status.write(f"Analyzing {len(urls)} profile(s)...")
     
-    for i, url in enumerate(urls):
-        status.write(f"Analyzing: {url}")
-        try:
-            rep = score_one_profile(
-                url, 
-                env_int("RESULTS_PER_QUERY", 5), 
+    # Each profile is judged as soon as its own evidence is in, so LLM calls overlap
+    # with the collection still running for other profiles.
+    with ThreadPoolExecutor(max_workers=min(len(urls), 8)) as executor:
+        collecting = {
+            executor.submit(
+                collect_profile_evidence,
+                url,
+                env_int("RESULTS_PER_QUERY", 5),
                 env_int("PER_PROFILE_QUERIES", 2)
-            )
-            results.append(rep)
-        except Exception as e:
-            st.error(f"Error scoring {url}: {e}")
-        
-        progress.progress((i + 1) / len(urls))
-        time.sleep(0.1)
+            ): url
+            for url in urls
+        }
+        judging = {}
+        done = 0
+        while collecting or judging:
+            finished, _ = wait(list(collecting) + list(judging), return_when=FIRST_COMPLETED)
+            for future in finished:
+                done += 1
+                if future in collecting:
+                    url = collecting.pop(future)
+                    try:
+                        judging[executor.submit(score_collected_profile, future.result())] = url
+                        status.write(f"Collected: {url}")
+                    except Exception as e:
+                        st.error(f"Error scoring {url}: {e}")
+                        done += 1
+                else:
+                    url = judging.pop(future)
+                    try:
+                        results_by_url[url] = future.result()
+                        status.write(f"Finished: {url}")
+                    except Exception as e:
+                        st.error(f"Error scoring {url}: {e}")
+            
+            progress.progress(min(1.0, done / (2 * len(urls))))
+    
+    results = [results_by_url[url] for url in urls if url in results_by_url]
     
     status.empty()
     progress.empty()